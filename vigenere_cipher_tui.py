@@ -10,7 +10,10 @@ It features a visually appealing text-based user interface (TUI) built with the
 
 import sys
 import string
-from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from rich.console import Console
 from rich.table import Table
@@ -33,62 +36,167 @@ LETTER_FREQUENCIES = {
 
 ALPHABET = string.ascii_uppercase
 
+EXPECTED_FREQUENCIES = np.array([LETTER_FREQUENCIES[c] for c in ALPHABET])
+
+# SHIFT_INDEX[s, j] is the ciphertext letter that decrypts to j under shift s
+SHIFT_INDEX = (np.arange(26)[:, None] + np.arange(26)[None, :]) % 26
+
+KEY_LENGTHS = np.arange(2, 21)
+
+# Kasiski is skipped below KASISKI_MIN_LETTERS, and stops early once KASISKI_PROOF_SPACINGS spacings,
+# and at least KASISKI_PROOF_SHARE of them, share a period
+KASISKI_MIN_LETTERS = 20
+KASISKI_PROOF_SPACINGS = 20
+KASISKI_PROOF_SHARE = 0.8
+# Divisors of the period whose column index of coincidence is within this ratio of the best one read like English;
+# proper divisors of the key length mix several shifts per column and fall well below it
+KASISKI_IC_RATIO = 0.92
+
+# Bigram counts per 100,000 letters of English prose; row is the first letter
+BIGRAM_FREQUENCIES = np.array([
+    [   8,  144,  465,  221,    1,   75,  136,    9,  168,    3,  100,  678,  219, 1801,    8,  212,   10,  839,  706, 1010,   48,  101,   41,   19,  289,    1],
+    [  28,   19,   13,    6,  612,    1,    1,    4,   55,   30,    0,  252,    1,    1,  221,    0,    0,   86,   86,   11,  123,    1,    1,    2,  358,    0],
+    [ 195,    9,   58,    7,  500,    2,    1,  442,  208,    1,  117,  109,    1,    3,  706,    5,    4,   74,    6,  459,  122,    0,    2,    0,    4,    0],
+    [ 302,  215,   68,   85,  532,   90,   48,   36,  688,    4,    3,  102,   70,   48,  229,   80,    6,   90,  201,  499,   60,   32,  116,    0,   50,    0],
+    [ 975,  288,  659,  981,  446,  681,  186,   90,  543,    3,   42,  446,  389, 1013,  471,  405,   82, 2046, 1596,  917,   41,  156,  251,  190,  179,    2],
+    [ 280,   22,   37,    9,  149,   88,   33,   10,  316,    1,    1,  186,   19,   12,  380,   14,    2,  483,   46,  787,   32,   12,   40,    0,   11,    0],
+    [ 101,   23,   12,   10,  273,   20,   17,  369,  135,    0,    1,  192,   27,   30,   93,   18,    2,  245,   91,  153,   57,    4,   19,    0,    3,    0],
+    [ 817,   33,   30,   28, 3369,   23,    9,   10,  717,    1,    1,   14,   29,   17,  330,   38,    2,  103,   37,  450,   34,    6,   49,    0,   19,    1],
+    [  82,  115,  469,  254,  179,  217,  357,   21,   20,    0,   44,  280,  203, 1852,  565,   33,   40,  417,  796,  910,   42,  104,    7,   69,    0,    9],
+    [   5,    0,    0,    1,   35,    0,    0,    0,    0,    0,    1,    0,    0,    0,    4,    0,    0,    0,    0,    1,    4,    0,    0,    0,    0,    0],
+    [  25,    6,   12,    4,  133,    4,    3,    2,   54,    0,    1,   13,    3,   68,   11,    8,    1,    8,   32,   17,    2,    2,    5,    1,    2,    0],
+    [ 443,   71,   28,  111,  815,   46,   12,    8,  520,    0,    3,  560,   34,   11,  457,   44,    2,   30,  120,  160,  183,   34,   23,    0,  272,    0],
+    [ 427,   68,    9,   15,  555,   15,    5,    7,  258,    0,    1,    4,   35,   16,  320,  109,    2,    8,   80,  161,   80,    4,   32,    0,   19,    0],
+    [ 323,   75,  464, 1335,  572,   83,  763,   17,  283,    1,    6,   58,   34,   55,  466,   54,    7,   23,  469, 1132,   65,   43,   70,    0,  108,    0],
+    [ 127,  235,   63,  142,   31, 1253,   72,   17,  109,    1,   41,  437,  457, 1167,  133,  215,    2,  812,  332,  657,  756,   82,  283,    1,    7,    1],
+    [ 398,    3,    0,    5,  449,    1,    1,   49,   67,    0,    0,  154,    1,    2,  346,  130,    4,  311,   16,   78,   41,    4,    8,    3,    0,    0],
+    [   4,    2,    2,    0,    1,    2,    0,    0,    2,    0,    1,    1,    0,    1,    0,    0,    0,    8,    3,    3,  172,    0,    0,    0,    0,    0],
+    [ 944,   97,  180,  219, 1771,  114,   72,   23,  621,    3,   37,   57,  133,   62,  651,  115,    3,   75,  433,  599,   76,   90,  104,    0,  144,    0],
+    [ 579,  183,  157,   71,  813,  101,   26,  187,  643,    1,   11,   82,  267,   59,  803,  257,   21,   66,  484, 1043,  302,   25,  221,    1,   29,    0],
+    [ 574,  145,   65,   47,  894,   77,   30, 4307, 1006,    1,    4,  142,   77,   28,  942,   83,   13,  331,  378,  532,  142,   15,  278,    7,   99,    1],
+    [ 127,   59,  145,   21,  133,   19,   97,    1,   59,    0,    0,  187,  165,  210,   21,  133,    0,  481,  236,  301,    6,    1,    4,    1,    0,    0],
+    [ 105,    1,    0,    2,  454,    0,    0,    0,  144,    0,    0,    0,    0,    1,   14,    1,    0,    0,    1,    5,    3,    0,    1,    1,    2,    0],
+    [ 286,   10,    7,   18,  208,    9,    7,  523,  319,    0,    0,    8,   12,   32,  124,    1,    0,    9,   31,   31,    1,    2,   12,    0,    0,    0],
+    [  10,    1,   22,   17,    9,    6,    2,   14,   71,    0,    0,    1,    1,    0,    5,   74,    0,    2,    3,   49,    0,    4,    3,    1,    4,    0],
+    [ 146,   90,   68,   43,  142,   42,   16,   21,   77,    0,    3,   26,   50,   20,  130,   41,    0,   76,  250,  251,   14,   15,   79,    0,    1,    0],
+    [   2,    0,    0,    1,    4,    0,    0,    0,    2,    0,    0,    0,    0,    0,    4,    0,    0,    0,    0,    1,    0,    0,    0,    0,    0,    0],
+])
+
+# log10 probability of each bigram, indexed by first * 26 + second; unseen pairs get half a count
+BIGRAM_LOG_PROBS = np.log10((BIGRAM_FREQUENCIES.ravel() + 0.5) / (BIGRAM_FREQUENCIES.sum() + 0.5 * 676))
+
+# Passes of the bigram hill-climb that corrects key letters after chi-square
+KEY_REFINE_PASSES = 3
+
+# A candidate is accepted without asking only when it is long, English-like and ahead of every alternative,
+# including its own key with one letter changed; on simulated licence text no wrong decryption passed these
+AUTO_CONFIRM_MIN_LETTERS = 200
+AUTO_CONFIRM_FITNESS = -2.5
+AUTO_CONFIRM_MARGIN = 0.03
+
+_UPPER_TABLE = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+_NON_LETTERS = bytes(c for c in range(128) if not chr(c).isalpha())
+
+def _letters(text):
+    # Upper-cased A-Z bytes of text, everything else dropped
+    data = text.encode('ascii', 'ignore').translate(_UPPER_TABLE, _NON_LETTERS)
+    return np.frombuffer(data, dtype=np.uint8)
+
+def _prepare(text):
+    # Letter indices 0-25 of text, the form all analysis functions take
+    return _letters(text).astype(np.int16) - 65
+
+def _vigenere_core(tt, kt, sign):
+    # tt and kt are letter indices; sign=1 encrypts, sign=-1 decrypts
+    # np.resize returns a fresh array, so it doubles as the output buffer
+    buf = np.resize(kt, tt.size)
+    buf *= sign
+    buf += tt
+    buf %= 26
+    buf += 65
+    return buf.astype(np.uint8).tobytes().decode('ascii')
+
+def _prepare_key(keyword):
+    kt = _prepare(keyword)
+    if not kt.size:
+        raise ValueError("Keyword must contain at least one letter A-Z.")
+    return kt
+
 def vigenere_encrypt(plaintext, keyword):
-    plaintext = ''.join([c.upper() for c in plaintext if c.isalpha()])
-    keyword = keyword.upper()
-    ciphertext = ''
-    keyword_length = len(keyword)
-    for i, char in enumerate(plaintext):
-        shift = ord(keyword[i % keyword_length]) - ord('A')
-        encrypted_char = chr((ord(char) - ord('A') + shift) % 26 + ord('A'))
-        ciphertext += encrypted_char
-    return ciphertext
+    return _vigenere_core(_prepare(plaintext), _prepare_key(keyword), 1)
 
 def vigenere_decrypt(ciphertext, keyword):
-    ciphertext = ''.join([c.upper() for c in ciphertext if c.isalpha()])
-    keyword = keyword.upper()
-    plaintext = ''
-    keyword_length = len(keyword)
-    for i, char in enumerate(ciphertext):
-        shift = ord(keyword[i % keyword_length]) - ord('A')
-        decrypted_char = chr((ord(char) - ord('A') - shift + 26) % 26 + ord('A'))
-        plaintext += decrypted_char
-    return plaintext
-
-def get_factors(n):
-    factors = set()
-    for i in range(2, min(n, 21)):
-        if n % i == 0:
-            factors.add(i)
-    return sorted(factors)
-
-def kasiski_examination(ciphertext):
-    sequences = {}
-    for seq_len in range(3, 6):
-        for i in range(len(ciphertext) - seq_len):
-            seq = ciphertext[i:i+seq_len]
-            if seq in sequences:
-                sequences[seq].append(i)
-            else:
-                sequences[seq] = [i]
-    spacings = []
-    for seq, positions in sequences.items():
-        if len(positions) > 1:
-            for i in range(len(positions) - 1):
-                spacing = positions[i+1] - positions[i]
-                spacings.append(spacing)
-    factors = []
-    for spacing in spacings:
-        factors.extend(get_factors(spacing))
-    factor_counts = Counter(factors)
-    probable_key_lengths = [factor for factor, count in factor_counts.items() if factor <= 20]
-    probable_key_lengths = sorted(probable_key_lengths, key=lambda x: -factor_counts[x])
-    return probable_key_lengths
-
-def friedman_test(ciphertext):
-    N = len(ciphertext)
-    freq = Counter(ciphertext)
-    IC = sum(f * (f - 1) for f in freq.values()) / (N * (N - 1)) if N > 1 else 0
+    return _vigenere_core(_prepare(ciphertext), _prepare_key(keyword), -1)
+
+def repeat_spacings(ct, seq_len):
+    # Distances between consecutive occurrences of every repeated seq_len-gram
+    if ct.size < seq_len:
+        return np.empty(0, dtype=np.int64)
+    windows = sliding_window_view(ct, seq_len)
+    keys = windows @ (26 ** np.arange(seq_len - 1, -1, -1))
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    same = sorted_keys[1:] == sorted_keys[:-1]
+    return order[1:][same] - order[:-1][same]
+
+def stable_period(spacings):
+    # Outlier-tolerant GCD: the largest number dividing at least KASISKI_PROOF_SHARE of the spacings,
+    # so a few chance repeats can't collapse it to 1. 0 unless KASISKI_PROOF_SPACINGS spacings agree
+    if spacings.size < KASISKI_PROOF_SPACINGS:
+        return 0
+    values, counts = np.unique(spacings, return_counts=True)
+    # The most common spacing comes from the key, so the period divides it
+    mode = values[counts.argmax()]
+    candidates = np.arange(2, mode + 1)
+    candidates = candidates[mode % candidates == 0]
+    support = counts @ (values[:, None] % candidates == 0)
+    agreed = candidates[(support >= KASISKI_PROOF_SHARE * spacings.size) & (support >= KASISKI_PROOF_SPACINGS)]
+    return int(agreed.max()) if agreed.size else 0
+
+def column_ic(ct, key_length):
+    # Mean index of coincidence of the key_length columns of ct
+    columns = np.arange(ct.size) % key_length
+    counts = np.bincount(columns * 26 + ct, minlength=key_length * 26).reshape(key_length, 26).astype(np.int64)
+    sizes = counts.sum(axis=1)
+    sizes = np.maximum(sizes * (sizes - 1), 1)
+    return float(((counts * (counts - 1)).sum(axis=1) / sizes).mean())
+
+@lru_cache(maxsize=32)
+def _kasiski_cached(ct_bytes):
+    ct = np.frombuffer(ct_bytes, dtype=np.int16)
+    if ct.size < KASISKI_MIN_LETTERS:
+        return ()
+    spacings = np.empty(0, dtype=np.int64)
+    # Longest repeats first; 3-letter repeats happen by chance too often to prove a period
+    for seq_len in (5, 4):
+        spacings = np.concatenate([spacings, repeat_spacings(ct, seq_len)])
+        period = stable_period(spacings)
+        divisors = KEY_LENGTHS[period % KEY_LENGTHS == 0] if period else KEY_LENGTHS[:0]
+        if divisors.size:
+            # The key length divides the period: rank divisors by how many spacings they divide,
+            # then move the shortest one whose columns read most like English to the front
+            support = (spacings[:, None] % divisors == 0).sum(axis=0)
+            ranked = [int(d) for d in divisors[np.lexsort((-divisors, -support))]]
+            ics = {d: column_ic(ct, d) for d in ranked}
+            best = min(d for d in ranked if ics[d] >= KASISKI_IC_RATIO * max(ics.values()))
+            ranked.remove(best)
+            ranked.insert(0, best)
+            return tuple(ranked)
+    spacings = np.concatenate([spacings, repeat_spacings(ct, 3)])
+    # Count, for each candidate length 2-20, the spacings it properly divides
+    hits = (spacings[:, None] % KEY_LENGTHS == 0) & (spacings[:, None] > KEY_LENGTHS)
+    factor_counts = hits.sum(axis=0)
+    probable_key_lengths = [int(factor) for factor, count in zip(KEY_LENGTHS, factor_counts) if count > 0]
+    probable_key_lengths = sorted(probable_key_lengths, key=lambda x: -factor_counts[x - 2])
+    return tuple(probable_key_lengths)
+
+def kasiski_examination(ct):
+    return list(_kasiski_cached(np.asarray(ct, dtype=np.int16).tobytes()))
+
+def friedman_test(ct):
+    N = ct.size
+    counts = np.bincount(ct, minlength=26).astype(np.int64)
+    IC = (counts * (counts - 1)).sum() / (N * (N - 1)) if N > 1 else 0
     # Constants for English
     K_english = 0.065
     K_random = 0.0385
@@ -98,31 +206,91 @@ def friedman_test(ciphertext):
     return round(k)
 
 def find_shift(segment):
-    chi_squares = []
-    for shift in range(26):
-        decrypted = ''.join(
-            [chr(((ord(c) - ord('A') - shift + 26) % 26) + ord('A')) for c in segment]
-        )
-        freq = Counter(decrypted)
-        total = sum(freq.values())
-        chi_sq = 0
-        for letter in ALPHABET:
-            observed = freq[letter] / total if total > 0 else 0
-            expected = LETTER_FREQUENCIES[letter]
-            chi_sq += ((observed - expected) ** 2) / expected if expected > 0 else 0
-        chi_squares.append(chi_sq)
-    min_shift = chi_squares.index(min(chi_squares))
-    return min_shift
-
-def frequency_analysis_decrypt(ciphertext, key_length):
-    key = ''
-    for i in range(key_length):
-        nth_letters = ciphertext[i::key_length]
-        shift = find_shift(nth_letters)
-        key += chr(shift + ord('A'))
-    plaintext = vigenere_decrypt(ciphertext, key)
+    # segment holds letter indices 0-25
+    obs = np.bincount(segment, minlength=26).astype(np.float64)
+    if segment.size:
+        obs /= segment.size
+    # Row s is the letter distribution after decrypting with shift s
+    shifted = obs[SHIFT_INDEX]
+    chi_squares = ((shifted - EXPECTED_FREQUENCIES) ** 2 / EXPECTED_FREQUENCIES).sum(axis=1)
+    return int(chi_squares.argmin())
+
+def column_scores(ct, shifts, i):
+    # Total bigram log10 probability of the text for each of the 26 shifts of key letter i,
+    # counting only the bigrams that touch column i
+    key_length = shifts.size
+    pt = (ct - np.resize(shifts, ct.size)) % 26
+    starts = np.arange(ct.size - 1)
+    pairs = starts[(starts % key_length == i) | ((starts + 1) % key_length == i)]
+    trials = np.arange(26)[:, None]
+    first = np.where(pairs % key_length == i, (ct[pairs] - trials) % 26, pt[pairs])
+    second = np.where((pairs + 1) % key_length == i, (ct[pairs + 1] - trials) % 26, pt[pairs + 1])
+    return BIGRAM_LOG_PROBS[first * 26 + second].sum(axis=1)
+
+def refine_key(ct, shifts):
+    # Chi-square on a short column can land on the wrong shift; re-pick each key letter
+    # by bigram fitness against its neighbours until nothing changes
+    shifts = shifts.copy()
+    for _ in range(KEY_REFINE_PASSES):
+        changed = False
+        for i in range(shifts.size):
+            best = int(column_scores(ct, shifts, i).argmax())
+            if best != shifts[i]:
+                shifts[i] = best
+                changed = True
+        if not changed:
+            break
+    return shifts
+
+def key_margin(ct, shifts):
+    # How much english_fitness drops when the weakest key letter is swapped for its best alternative
+    if ct.size < 2:
+        return 0.0
+    losses = []
+    for i in range(shifts.size):
+        scores = column_scores(ct, shifts, i)
+        losses.append(scores[shifts[i]] - np.delete(scores, shifts[i]).max())
+    return float(min(losses)) / (ct.size - 1)
+
+@lru_cache(maxsize=32)
+def _freq_cached(ct_bytes, key_length):
+    ct = np.frombuffer(ct_bytes, dtype=np.int16)
+    shifts = np.array([find_shift(ct[i::key_length]) for i in range(key_length)], dtype=np.int16)
+    shifts = refine_key(ct, shifts)
+    key = (shifts + 65).astype(np.uint8).tobytes().decode('ascii')
+    plaintext = _vigenere_core(ct, shifts, -1)
     return key, plaintext
 
+def frequency_analysis_decrypt(ct, key_length):
+    return _freq_cached(np.asarray(ct, dtype=np.int16).tobytes(), key_length)
+
+def english_fitness(pt):
+    # Mean bigram log10 probability of letter indices pt; English prose scores around -2.4
+    if pt.size < 2:
+        return float(BIGRAM_LOG_PROBS.min())
+    return float(BIGRAM_LOG_PROBS[pt[:-1] * 26 + pt[1:]].mean())
+
+def rank_candidates(ct, key_lengths):
+    # Decryptions ordered by English fitness, as (plaintext, (key_length, key, fitness));
+    # multiples of a key length give the same text, so only the shortest is kept
+    candidates = {}
+    for key_length in sorted(key_lengths):
+        key, plaintext = frequency_analysis_decrypt(ct, key_length)
+        if plaintext not in candidates:
+            candidates[plaintext] = (key_length, key, english_fitness(_prepare(plaintext)))
+    return sorted(candidates.items(), key=lambda item: -item[1][2])
+
+def is_clear_winner(ct, ranked):
+    # The runner-up is the better of the next candidate and the top key with its weakest letter
+    # changed, so a lone candidate still has to beat its own near misses
+    if ct.size < AUTO_CONFIRM_MIN_LETTERS or not ranked:
+        return False
+    key_length, key, best = ranked[0][1]
+    runner_up = best - key_margin(ct, _prepare(key))
+    if len(ranked) > 1:
+        runner_up = max(runner_up, ranked[1][1][2])
+    return best >= AUTO_CONFIRM_FITNESS and best - runner_up >= AUTO_CONFIRM_MARGIN
+
 def display_banner():
     banner = """
       __     ___                   __              ____ _       _
@@ -157,7 +325,7 @@ def encrypt_flow():
         console.print("[bold red]Error:[/] Plaintext cannot be empty.", style="bold red")
         return
     keyword = Prompt.ask("[bold]Enter the keyword (letters only)[/]")
-    if not keyword.isalpha():
+    if not (keyword.isascii() and keyword.isalpha()):
         console.print("[bold red]Error:[/] Invalid keyword. Please enter letters only.", style="bold red")
         return
     ciphertext = vigenere_encrypt(plaintext, keyword)
@@ -176,7 +344,7 @@ def decrypt_flow():
         console.print("[bold red]Error:[/] Ciphertext cannot be empty.", style="bold red")
         return
     keyword = Prompt.ask("[bold]Enter the keyword (letters only)[/]")
-    if not keyword.isalpha():
+    if not (keyword.isascii() and keyword.isalpha()):
         console.print("[bold red]Error:[/] Invalid keyword. Please enter letters only.", style="bold red")
         return
     plaintext = vigenere_decrypt(ciphertext, keyword)
@@ -194,17 +362,22 @@ def auto_decrypt_flow():
     if not ciphertext.strip():
         console.print("[bold red]Error:[/] Ciphertext cannot be empty.", style="bold red")
         return
-    ciphertext = ''.join([c.upper() for c in ciphertext if c.isalpha()])
-    if not ciphertext:
+    ct = _prepare(ciphertext)
+    if not ct.size:
         console.print("[bold red]Error:[/] Ciphertext must contain alphabetic characters.", style="bold red")
         return
 
-    console.print("\n[bold cyan]Performing Kasiski Examination...[/]", style="bold cyan")
-    probable_key_lengths = kasiski_examination(ciphertext)
+    if ct.size < KASISKI_MIN_LETTERS:
+        console.print(f"\n[bold yellow]Skipping Kasiski Examination: the text has fewer than {KASISKI_MIN_LETTERS} letters.[/]", style="bold yellow")
+        probable_key_lengths = []
+    else:
+        console.print("\n[bold cyan]Performing Kasiski Examination...[/]", style="bold cyan")
+        probable_key_lengths = kasiski_examination(ct)
+        if not probable_key_lengths:
+            console.print("[bold yellow]Kasiski Examination failed to find repeating sequences.[/]", style="bold yellow")
     if not probable_key_lengths:
-        console.print("[bold yellow]Kasiski Examination failed to find repeating sequences.[/]", style="bold yellow")
         console.print("[bold cyan]Attempting Friedman Test...[/]", style="bold cyan")
-        estimated_length = friedman_test(ciphertext)
+        estimated_length = friedman_test(ct)
         if estimated_length > 1:
             probable_key_lengths = [estimated_length]
             console.print(f"[bold green]Friedman Test estimated key length: {estimated_length}[/]", style="bold green")
@@ -216,12 +389,17 @@ def auto_decrypt_flow():
         console.print(f"[bold green]Probable key lengths from Kasiski Examination: {probable_key_lengths}[/]", style="bold green")
 
     console.print("\n[bold cyan]Attempting frequency analysis to deduce the key and decrypt the text...[/]", style="bold cyan")
-    for key_length in probable_key_lengths:
-        key, plaintext = frequency_analysis_decrypt(ciphertext, key_length)
+    ranked = rank_candidates(ct, probable_key_lengths)
+    auto_confirm = is_clear_winner(ct, ranked)
+    for plaintext, (key_length, key, fitness) in ranked:
         console.print(f"\n[bold blue]Attempting with key length {key_length}:[/]", style="bold blue")
         console.print(f"[bold magenta]Possible Key:[/] {key}", style="bold magenta")
         console.print(f"[bold magenta]Decrypted Text:[/]\n{plaintext}", style="bold magenta")
-        confirmation = Prompt.ask("\n[bold]Does the decrypted text make sense? (y/n)[/]", choices=["y", "n"], default="n")
+        if auto_confirm:
+            console.print(f"\n[bold green]English fitness {fitness:.2f} clearly beats every alternative key; accepting it.[/]", style="bold green")
+            confirmation = 'y'
+        else:
+            confirmation = Prompt.ask("\n[bold]Does the decrypted text make sense? (y/n)[/]", choices=["y", "n"], default="n")
         if confirmation.lower() == 'y':
             console.print("\n[bold green]Auto-Decryption successful![/]", style="bold green")
             result_panel = Panel(